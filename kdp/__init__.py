@@ -8,7 +8,7 @@ from kdp.processor import (
     PreprocessingModel,
     TransformerBlockPlacementOptions,
 )
-from kdp.stats import DatasetStatistics
+from kdp.stats import DatasetStatistics, ReaderOptions
 
 __all__ = [
     "ProcessingStep",
@@ -20,6 +20,7 @@ __all__ = [
     "TextFeature",
     "DateFeature",
     "DatasetStatistics",
+    "ReaderOptions",
     "PreprocessorLayerFactory",
     "PreprocessingModel",
     "CategoryEncodingOptions",
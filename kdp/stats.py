@@ -1,4 +1,9 @@
+import copy
+import csv
+import functools
 import json
+import multiprocessing
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -6,7 +11,61 @@ import numpy as np
 import tensorflow as tf
 from loguru import logger
 
-from kdp.features import CategoricalFeature, FeatureType, NumericalFeature
+try:
+    import pyarrow as pa
+    from pyarrow import compute as pa_compute
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover
+    pa = None
+
+from kdp.features import CategoricalFeature, Feature, FeatureType, NumericalFeature
+
+# size in bytes of the CSV blocks parsed at once by the PyArrow reader
+_ARROW_BLOCK_SIZE = 256 << 20
+
+
+class ReaderOptions:
+    TF_DATA = "tf"
+    ARROW = "arrow"
+
+
+def _batch_moments(values: np.ndarray) -> tuple:
+    """Computes the (count, mean, sum of squared deviations) of a batch along its first axis.
+
+    The batch itself stays in float32, but the reductions accumulate in float64
+    to avoid losing precision on the sum of squared deviations for large counts.
+
+    Args:
+        values: Array of shape [batch_size] or [batch_size, nr_columns].
+
+    Returns:
+        tuple: The count of rows and the per-column float64 mean and sum of squared deviations.
+    """
+    n = values.shape[0]
+    return n, values.mean(axis=0, dtype=np.float64), values.var(axis=0, dtype=np.float64) * n
+
+
+def _combine_moments(n_a, mean_a, m2_a, n_b, mean_b, m2_b) -> tuple:
+    """Merges two sets of (count, mean, sum of squared deviations) using Chan's parallel algorithm.
+
+    Works element-wise, so the moments can be scalars or arrays of the same shape.
+
+    Args:
+        n_a: Number of values in the first set.
+        mean_a: Mean of the first set.
+        m2_a: Sum of squared deviations from the mean of the first set.
+        n_b: Number of values in the second set.
+        mean_b: Mean of the second set.
+        m2_b: Sum of squared deviations from the mean of the second set.
+
+    Returns:
+        tuple: The (count, mean, sum of squared deviations) of the union of both sets.
+    """
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + delta * delta * n_a * n_b / n
+    return n, mean, m2
 
 
 class WelfordAccumulator:
@@ -16,89 +75,137 @@ class WelfordAccumulator:
 
     def __init__(self):
         """Initializes the accumulators for the Welford algorithm."""
-        self.n = tf.Variable(
-            0.0,
-            dtype=tf.float32,
-            trainable=False,
-        )
-        self.mean = tf.Variable(
-            0.0,
-            dtype=tf.float32,
-            trainable=False,
-        )
-        self.M2 = tf.Variable(
-            0.0,
-            dtype=tf.float32,
-            trainable=False,
-        )
-        self.var = tf.Variable(
-            0.0,
-            dtype=tf.float32,
-            trainable=False,
-        )
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0
 
-    @tf.function
     def update(self, values: tf.Tensor) -> None:
         """Updates the accumulators with new values using the Welford algorithm.
 
+        The moments of the batch are computed first and then merged into the running state.
+
         Args:
             values: The new values to add to the accumulators.
         """
-        values = tf.cast(values, tf.float32)
-        n = self.n + tf.cast(tf.size(values), tf.float32)
-        delta = values - self.mean
-        self.mean.assign(self.mean + tf.reduce_sum(delta / n))
-        self.M2.assign(self.M2 + tf.reduce_sum(delta * (values - self.mean)))
-        self.n.assign(n)
+        values = np.asarray(values, dtype=np.float32).ravel()
+        if values.size == 0:
+            return
+        self.merge(*_batch_moments(values))
+
+    def merge(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        """Merges the moments of a batch of values into the accumulators.
+
+        Args:
+            n_b: Number of values in the batch.
+            mean_b: Mean of the batch.
+            m2_b: Sum of squared deviations from the mean of the batch.
+        """
+        if n_b == 0:
+            return
+        n, mean, m2 = _combine_moments(
+            n_a=self.n,
+            mean_a=self.mean,
+            m2_a=self.M2,
+            n_b=n_b,
+            mean_b=mean_b,
+            m2_b=m2_b,
+        )
+        self.n = int(n)
+        self.mean = float(mean)
+        self.M2 = float(m2)
 
     @property
     def variance(self) -> float:
         """Returns the variance of the accumulated values."""
-        return self.M2 / (self.n - 1) if self.n > 1 else self.var
+        return self.M2 / (self.n - 1) if self.n > 1 else 0.0
 
     @property
     def count(self) -> int:
         """Returns the number of accumulated values."""
         return self.n
 
+    @classmethod
+    def combine(cls, stats_a: "WelfordAccumulator", stats_b: "WelfordAccumulator") -> "WelfordAccumulator":
+        """Combines two accumulators built over disjoint sets of values.
+
+        Args:
+            stats_a: The first accumulator.
+            stats_b: The second accumulator.
+
+        Returns:
+            WelfordAccumulator: A new accumulator holding the statistics of both sets of values.
+        """
+        combined = cls()
+        combined.merge(n_b=stats_a.n, mean_b=stats_a.mean, m2_b=stats_a.M2)
+        combined.merge(n_b=stats_b.n, mean_b=stats_b.mean, m2_b=stats_b.M2)
+        return combined
+
 
 class CategoricalAccumulator:
-    def __init__(self) -> None:
-        """Initializes the accumulator for categorical values."""
-        # Using a single accumulator since tf.string can hold both strings and bytes
-        self.values = tf.Variable(
-            [],
-            dtype=tf.string,
-            shape=tf.TensorShape(None),
-            trainable=False,
-        )
-        self.int_values = tf.Variable(
-            [],
-            dtype=tf.int32,
-            shape=tf.TensorShape(None),
-            trainable=False,
-        )
+    def __init__(self, dtype: tf.dtypes.DType = tf.string) -> None:
+        """Initializes the accumulator for categorical values.
+
+        Args:
+            dtype: The data type of the categorical values, either tf.string or tf.int32 (defaults to tf.string).
+
+        Raises:
+            ValueError: If the data type is not supported.
+        """
+        if dtype not in (tf.string, tf.int32):
+            raise ValueError(f"Unsupported data type for categorical features: {dtype}")
+        self.dtype = dtype
+        # insertion-ordered dict used as a hash set: the update cost stays proportional to the batch size
+        # and the vocabulary keeps the first-seen order, so it is stable from one run to another
+        self._values: dict[bytes | int, None] = {}
 
-    @tf.function
     def update(self, new_values: tf.Tensor) -> None:
         """Updates the accumulator with new categorical values.
 
         Args:
             new_values: The new categorical values to add to the accumulator.
+
+        Raises:
+            ValueError: If the values do not match the data type of the accumulator.
         """
-        if new_values.dtype == tf.string:
-            updated_values = tf.unique(tf.concat([self.values, new_values], axis=0))[0]
-            self.values.assign(updated_values)
-        elif new_values.dtype == tf.int32:
-            updated_values = tf.unique(tf.concat([self.int_values, new_values], axis=0))[0]
-            self.int_values.assign(updated_values)
-        else:
+        if self.dtype == tf.string and new_values.dtype.is_integer:
+            # digit-only string categories (IDs, zip codes) are inferred as integers by the CSV reader
+            new_values = tf.strings.as_string(new_values)
+        if new_values.dtype != self.dtype:
             raise ValueError(f"Unsupported data type for categorical features: {new_values.dtype}")
+        if new_values.shape.num_elements() == 0:
+            return
+        self._values.update(dict.fromkeys(new_values.numpy().tolist()))
 
     def get_unique_values(self) -> list:
-        """Returns the unique categorical values accumulated so far."""
-        all_values = tf.concat([self.values, tf.strings.as_string(self.int_values)], axis=0)
-        return tf.unique(all_values)[0].numpy().tolist()
+        """Returns the unique categorical values accumulated so far.
+
+        Returns:
+            list: Sorted Python ints for integer categorical values,
+                raw bytes in first-seen order for string values otherwise.
+        """
+        if self.dtype == tf.int32:
+            return sorted(self._values)
+        return list(self._values)
+
+    @classmethod
+    def combine(cls, stats_a: "CategoricalAccumulator", stats_b: "CategoricalAccumulator") -> "CategoricalAccumulator":
+        """Combines two accumulators, values of the first one come first in the vocabulary.
+
+        Args:
+            stats_a: The first accumulator.
+            stats_b: The second accumulator.
+
+        Returns:
+            CategoricalAccumulator: A new accumulator holding the union of both vocabularies.
+
+        Raises:
+            ValueError: If the accumulators do not share the same data type.
+        """
+        if stats_a.dtype != stats_b.dtype:
+            raise ValueError(f"Cannot combine categorical accumulators of types: {stats_a.dtype} and {stats_b.dtype}")
+        combined = cls(dtype=stats_a.dtype)
+        combined._values = {**stats_a._values, **stats_b._values}
+        return combined
 
 
 class TextAccumulator:
@@ -106,17 +213,11 @@ class TextAccumulator:
         """Initializes the accumulator for text values, where each entry is a list of words separated by spaces.
 
         Attributes:
-            words (tf.Variable): TensorFlow variable to store unique words as strings.
+            _words (dict[bytes, None]): Unique words accumulated so far, in first-seen order.
         """
-        self.words = tf.Variable(
-            [],
-            dtype=tf.string,
-            shape=tf.TensorShape(None),
-            trainable=False,
-        )
+        self._words: dict[bytes, None] = {}
         logger.info("TextAccumulator initialized.")
 
-    @tf.function
     def update(self, new_texts: tf.Tensor) -> None:
         """Updates the accumulator with new text values, extracting words and accumulating unique ones.
 
@@ -130,28 +231,43 @@ class TextAccumulator:
         if new_texts.dtype != tf.string:
             raise ValueError(f"Unsupported data type for text features: {new_texts.dtype}")
 
-        # Split each string into words and flatten the list
-        new_texts = tf.strings.regex_replace(new_texts, r"\s+", " ")
-        split_words = tf.strings.split(new_texts).flat_values
-        split_words = tf.strings.lower(split_words)
+        # Lowercase each string, then split on whitespace runs and flatten the list
+        split_words = tf.strings.split(tf.strings.lower(new_texts)).flat_values
 
-        # Concatenate new words with existing words and update unique words
-        updated_words = tf.unique(tf.concat([self.words, split_words], axis=0))[0]
-        self.words.assign(updated_words)
+        # Only the words of the current batch are hashed, the first-seen order is preserved
+        self._words.update(dict.fromkeys(split_words.numpy().tolist()))
 
     def get_unique_words(self) -> list:
         """Returns the unique words accumulated so far as a list of strings.
 
         Returns:
-            list of str: Unique words accumulated.
+            list of str: Unique words accumulated, in first-seen order.
+        """
+        return [_word.decode("utf-8") for _word in self._words]
+
+    @classmethod
+    def combine(cls, stats_a: "TextAccumulator", stats_b: "TextAccumulator") -> "TextAccumulator":
+        """Combines two accumulators, words of the first one come first in the vocabulary.
+
+        Args:
+            stats_a: The first accumulator.
+            stats_b: The second accumulator.
+
+        Returns:
+            TextAccumulator: A new accumulator holding the union of both vocabularies.
         """
-        unique_words = self.words.value().numpy().tolist()
-        return unique_words
+        combined = cls()
+        combined._words = {**stats_a._words, **stats_b._words}
+        return combined
 
 
 class DateAccumulator:
     """Accumulator for computing statistics of date features including cyclical encoding."""
 
+    # radians per month and per day of the week for the cyclical encoding
+    _MONTH_TO_RAD = np.float32(2 * np.pi / 12)
+    _DAY_OF_WEEK_TO_RAD = np.float32(2 * np.pi / 7)
+
     def __init__(self):
         """Initializes the accumulators for date features."""
         # For year, month, and day of the week
@@ -161,52 +277,88 @@ class DateAccumulator:
         self.day_of_week_sin_accumulator = WelfordAccumulator()
         self.day_of_week_cos_accumulator = WelfordAccumulator()
 
-    @tf.function
     def update(self, dates: tf.Tensor) -> None:
         """Updates the accumulators with new date values.
 
         Args:
             dates: A tensor of shape [batch_size, 3] where each row contains [year, month, day_of_week].
         """
+        dates = np.asarray(dates, dtype=np.float32)
+        if dates.shape[0] == 0:
+            return
         year = dates[:, 0]
         month = dates[:, 1]
         day_of_week = dates[:, 2]
 
-        # Cyclical encoding
-        pi = tf.math.pi
-        month_sin = tf.math.sin(2 * pi * month / 12)
-        month_cos = tf.math.cos(2 * pi * month / 12)
-        day_of_week_sin = tf.math.sin(2 * pi * day_of_week / 7)
-        day_of_week_cos = tf.math.cos(2 * pi * day_of_week / 7)
-
-        self.year_accumulator.update(year)
-        self.month_sin_accumulator.update(month_sin)
-        self.month_cos_accumulator.update(month_cos)
-        self.day_of_week_sin_accumulator.update(day_of_week_sin)
-        self.day_of_week_cos_accumulator.update(day_of_week_cos)
+        # Cyclical encoding, stacked so all five columns are reduced in a single pass
+        month_angle = self._MONTH_TO_RAD * month
+        day_of_week_angle = self._DAY_OF_WEEK_TO_RAD * day_of_week
+        values = np.stack(
+            [
+                year,
+                np.sin(month_angle),
+                np.cos(month_angle),
+                np.sin(day_of_week_angle),
+                np.cos(day_of_week_angle),
+            ],
+            axis=1,
+        )
+        n_b, means_b, m2s_b = _batch_moments(values)
+
+        accumulators = (
+            self.year_accumulator,
+            self.month_sin_accumulator,
+            self.month_cos_accumulator,
+            self.day_of_week_sin_accumulator,
+            self.day_of_week_cos_accumulator,
+        )
+        for accumulator, mean_b, m2_b in zip(accumulators, means_b, m2s_b, strict=True):
+            accumulator.merge(n_b=n_b, mean_b=mean_b, m2_b=m2_b)
 
     @property
     def mean(self) -> dict:
         """Returns the mean statistics for date features."""
         return {
-            "year": self.year_accumulator.mean.numpy(),
-            "month_sin": self.month_sin_accumulator.mean.numpy(),
-            "month_cos": self.month_cos_accumulator.mean.numpy(),
-            "day_of_week_sin": self.day_of_week_sin_accumulator.mean.numpy(),
-            "day_of_week_cos": self.day_of_week_cos_accumulator.mean.numpy(),
+            "year": self.year_accumulator.mean,
+            "month_sin": self.month_sin_accumulator.mean,
+            "month_cos": self.month_cos_accumulator.mean,
+            "day_of_week_sin": self.day_of_week_sin_accumulator.mean,
+            "day_of_week_cos": self.day_of_week_cos_accumulator.mean,
         }
 
     @property
     def variance(self) -> dict:
         """Returns the variance statistics for date features."""
         return {
-            "year": self.year_accumulator.variance.numpy(),
-            "month_sin": self.month_sin_accumulator.variance.numpy(),
-            "month_cos": self.month_cos_accumulator.variance.numpy(),
-            "day_of_week_sin": self.day_of_week_sin_accumulator.variance.numpy(),
-            "day_of_week_cos": self.day_of_week_cos_accumulator.variance.numpy(),
+            "year": self.year_accumulator.variance,
+            "month_sin": self.month_sin_accumulator.variance,
+            "month_cos": self.month_cos_accumulator.variance,
+            "day_of_week_sin": self.day_of_week_sin_accumulator.variance,
+            "day_of_week_cos": self.day_of_week_cos_accumulator.variance,
         }
 
+    @classmethod
+    def combine(cls, stats_a: "DateAccumulator", stats_b: "DateAccumulator") -> "DateAccumulator":
+        """Combines two accumulators built over disjoint sets of dates.
+
+        Args:
+            stats_a: The first accumulator.
+            stats_b: The second accumulator.
+
+        Returns:
+            DateAccumulator: A new accumulator holding the statistics of both sets of dates.
+        """
+        combined = cls()
+        for name in [
+            "year_accumulator",
+            "month_sin_accumulator",
+            "month_cos_accumulator",
+            "day_of_week_sin_accumulator",
+            "day_of_week_cos_accumulator",
+        ]:
+            setattr(combined, name, WelfordAccumulator.combine(getattr(stats_a, name), getattr(stats_b, name)))
+        return combined
+
 
 class DatasetStatistics:
     def __init__(
@@ -220,6 +372,7 @@ class DatasetStatistics:
         features_stats_path: Path = None,
         overwrite_stats: bool = False,
         batch_size: int = 50_000,
+        reader: str = ReaderOptions.TF_DATA,
     ) -> None:
         """Initializes the statistics accumulators for numeric, categorical, text, and date features.
 
@@ -235,22 +388,100 @@ class DatasetStatistics:
             categorical_features: A list of categorical features to calculate statistics for (defaults to None).
             text_features: A list of text features to calculate statistics for (defaults to None).
             date_features: A list of date features to calculate statistics for (defaults to None).
+            reader:
+                The CSV reader used by `main` (tf | arrow, defaults to tf). The arrow reader needs the `arrow` extra,
+                unlike tf.data it does not skip records with unparsable values but raises a ValueError.
+
+        Raises:
+            ValueError: If the reader is not supported.
+            ImportError: If the arrow reader is requested but pyarrow is not installed.
         """
+        if reader not in (ReaderOptions.TF_DATA, ReaderOptions.ARROW):
+            raise ValueError(f"Unsupported reader: {reader}")
+        if reader == ReaderOptions.ARROW and pa is None:
+            raise ImportError("The arrow reader requires pyarrow, install it with: pip install kdp[arrow]")
         self.path_data = path_data
         self.numeric_features = numeric_features or []
         self.categorical_features = categorical_features or []
         self.text_features = text_features or []
         self.date_features = date_features or []
         self.features_specs = features_specs or {}
-        self.features_stats_path = features_stats_path or "features_stats.json"
+        self.features_stats_path = Path(features_stats_path or "features_stats.json")
         self.overwrite_stats = overwrite_stats
         self.batch_size = batch_size
+        self.reader = reader
 
         # Initializing placeholders for statistics
-        self.numeric_stats = {col: WelfordAccumulator() for col in self.numeric_features}
-        self.categorical_stats = {col: CategoricalAccumulator() for col in self.categorical_features}
-        self.text_stats = {col: TextAccumulator() for col in self.text_features}
-        self.date_stats = {col: DateAccumulator() for col in self.date_features}
+        self._set_accumulators(
+            numeric_stats={col: WelfordAccumulator() for col in self.numeric_features},
+            categorical_stats={
+                col: CategoricalAccumulator(dtype=self.features_specs[col].dtype) for col in self.categorical_features
+            },
+            text_stats={col: TextAccumulator() for col in self.text_features},
+            date_stats={col: DateAccumulator() for col in self.date_features},
+        )
+
+    def __getstate__(self) -> dict:
+        """Drops the tf.data pipeline, which cannot be pickled, when sending the instance to another process."""
+        state = self.__dict__.copy()
+        state.pop("ds", None)
+        return state
+
+    def _set_accumulators(
+        self,
+        numeric_stats: dict[str, WelfordAccumulator],
+        categorical_stats: dict[str, CategoricalAccumulator],
+        text_stats: dict[str, TextAccumulator],
+        date_stats: dict[str, DateAccumulator],
+    ) -> None:
+        """Sets the statistics accumulators of every feature.
+
+        Args:
+            numeric_stats: Accumulators of the numeric features.
+            categorical_stats: Accumulators of the categorical features.
+            text_stats: Accumulators of the text features.
+            date_stats: Accumulators of the date features.
+        """
+        self.numeric_stats = numeric_stats
+        self.categorical_stats = categorical_stats
+        self.text_stats = text_stats
+        self.date_stats = date_stats
+
+        # (feature, accumulator) pairs resolved once instead of on every batch
+        self._numeric_items = list(self.numeric_stats.items())
+        self._categorical_items = list(self.categorical_stats.items())
+        self._text_items = list(self.text_stats.items())
+        self._date_items = list(self.date_stats.items())
+
+    @classmethod
+    def combine(cls, stats_a: "DatasetStatistics", stats_b: "DatasetStatistics") -> "DatasetStatistics":
+        """Combines the accumulators of two instances built over disjoint parts of the same dataset.
+
+        Args:
+            stats_a: The first instance, its settings are kept for the combined one.
+            stats_b: The second instance.
+
+        Returns:
+            DatasetStatistics: A new instance holding the accumulated statistics of both parts.
+        """
+        combined = copy.copy(stats_a)
+        combined._set_accumulators(
+            numeric_stats={
+                col: WelfordAccumulator.combine(acc, stats_b.numeric_stats[col])
+                for col, acc in stats_a.numeric_stats.items()
+            },
+            categorical_stats={
+                col: CategoricalAccumulator.combine(acc, stats_b.categorical_stats[col])
+                for col, acc in stats_a.categorical_stats.items()
+            },
+            text_stats={
+                col: TextAccumulator.combine(acc, stats_b.text_stats[col]) for col, acc in stats_a.text_stats.items()
+            },
+            date_stats={
+                col: DateAccumulator.combine(acc, stats_b.date_stats[col]) for col, acc in stats_a.date_stats.items()
+            },
+        )
+        return combined
 
     def _get_csv_file_pattern(self, path) -> str:
         """Get the csv file pattern that will handle directories and file paths.
@@ -273,37 +504,158 @@ class DatasetStatistics:
 
         return str(csv_pattern)
 
-    def _read_data_into_dataset(self) -> tf.data.Dataset:
-        """Reading CSV files from the provided path into a tf.data.Dataset."""
-        logger.info(f"Reading CSV data from the corresponding folder: {self.path_data}")
+    def _get_csv_files(self) -> list[Path]:
+        """Lists the CSV files of the provided path, sorted by name."""
         _path_csvs_regex = self._get_csv_file_pattern(path=self.path_data)
+        return sorted(Path(_path_csvs_regex).parent.glob("*.csv"))
+
+    def _read_data_into_dataset(self, paths_csvs: list[Path] = None) -> tf.data.Dataset:
+        """Reading CSV files from the provided path into a tf.data.Dataset, only reading the feature columns.
+
+        Records with a missing value in any feature column, or that cannot be parsed, are skipped.
+
+        Args:
+            paths_csvs: The CSV files to read (defaults to None, reading all CSV files of the provided path).
+
+        Raises:
+            ValueError: If there are no CSV files to read.
+        """
+        logger.info(f"Reading CSV data from the corresponding folder: {self.path_data}")
+        _paths_csvs = self._get_csv_files() if paths_csvs is None else paths_csvs
+        if not _paths_csvs:
+            raise ValueError(f"No CSV files found in: {self.path_data}")
+        select_columns, column_defaults = self._get_tf_column_defaults(path_csv=_paths_csvs[0])
         self.ds = tf.data.experimental.make_csv_dataset(
-            file_pattern=_path_csvs_regex,
+            file_pattern=[str(_path_csv) for _path_csv in _paths_csvs],
             num_epochs=1,
             shuffle=False,
             ignore_errors=True,
             batch_size=self.batch_size,
+            select_columns=select_columns,
+            column_defaults=column_defaults,
         )
         logger.info(f"DataSet Ready to be used (batched by: {self.batch_size}) ✅")
         return self.ds
 
-    def _process_batch(self, batch: tf.Tensor) -> None:
-        """Update statistics accumulators for each batch.
+    def _get_tf_column_defaults(self, path_csv: Path) -> tuple[list[str], list[tf.Tensor]]:
+        """Lists the feature columns with their defaults, in the column order of the CSV header.
+
+        The defaults are empty, so a record with a missing value in any feature column is dropped (the same way
+        as the arrow reader) instead of being filled with 0 or an empty string.
 
         Args:
-            batch: A batch of data from the dataset.
+            path_csv: A CSV file of the dataset, whose header gives the column order.
         """
-        for feature in self.numeric_features:
-            self.numeric_stats[feature].update(batch[feature])
-
+        with Path(path_csv).open(newline="") as f:
+            header = next(csv.reader(f))
+        column_types = {feature: tf.float32 for feature in self.numeric_features}
         for feature in self.categorical_features:
-            self.categorical_stats[feature].update(batch[feature])
+            column_types[feature] = self.features_specs[feature].dtype
+        for feature in self.text_features + self.date_features:
+            column_types[feature] = tf.string
+        select_columns = [column for column in header if column in column_types]
+        return select_columns, [tf.constant([], dtype=column_types[column]) for column in select_columns]
+
+    def _get_arrow_column_types(self) -> dict:
+        """Map each feature to the Arrow type its CSV column is parsed into."""
+        column_types = {feature: pa.float32() for feature in self.numeric_features}
+        for feature in self.categorical_features:
+            _is_int = self.features_specs[feature].dtype == tf.int32
+            column_types[feature] = pa.int32() if _is_int else pa.binary()
+        for feature in self.text_features + self.date_features:
+            column_types[feature] = pa.binary()
+        return column_types
+
+    def _read_data_into_batches(self, paths_csvs: list[Path] = None) -> Iterator[dict]:
+        """Streaming CSV files from the provided path with PyArrow, only reading the feature columns.
+
+        Arrow parses the CSV blocks in native code, the numeric columns are handed over as zero-copy NumPy arrays
+        and the categorical, text and date columns as tensors. Each block is sliced into batches of at most
+        `batch_size` rows.
+
+        Note:
+            Rows with a wrong number of columns or with a missing value (an empty cell) in any feature column are
+            skipped, but a value that cannot be parsed into its column type (e.g. `abc` in a numeric column)
+            raises instead of dropping the record.
+
+        Args:
+            paths_csvs: The CSV files to read (defaults to None, reading all CSV files of the provided path).
+
+        Yields:
+            dict: A batch mapping each feature name to its column values.
 
-        for feature in self.text_features:
-            self.text_stats[feature].update(batch[feature])
+        Raises:
+            ValueError: If a value of a CSV file cannot be parsed into the type of its column.
+        """
+        _paths_csvs = self._get_csv_files() if paths_csvs is None else paths_csvs
+        logger.info(f"Reading {len(_paths_csvs)} CSV files with PyArrow from: {self.path_data}")
+        column_types = self._get_arrow_column_types()
+        read_options = pa_csv.ReadOptions(block_size=_ARROW_BLOCK_SIZE)
+        # skipping rows with a wrong number of columns
+        parse_options = pa_csv.ParseOptions(invalid_row_handler=lambda _: "skip")
+        # only empty cells are missing values, including in the string columns
+        convert_options = pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=list(column_types),
+            null_values=[""],
+            strings_can_be_null=True,
+        )
+
+        for _path_csv in _paths_csvs:
+            try:
+                reader = pa_csv.open_csv(
+                    _path_csv,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
+                )
+                for record_block in reader:
+                    # skipping rows with a missing value in any feature column
+                    record_block = pa_compute.drop_null(record_block)
+                    for offset in range(0, record_block.num_rows, self.batch_size):
+                        yield self._arrow_batch_to_dict(record_block.slice(offset, self.batch_size))
+            except pa.ArrowInvalid as e:
+                raise ValueError(f"Could not parse {_path_csv} with the arrow reader, use the tf reader instead: {e}")
+
+    @staticmethod
+    def _arrow_batch_to_dict(record_batch: "pa.RecordBatch") -> dict:
+        """Converts an Arrow record batch into a batch mapping each feature name to its column values.
 
-        for feature in self.date_features:
-            self.date_stats[feature].update(batch[feature])
+        Args:
+            record_batch: The Arrow record batch to convert.
+        """
+        batch = {}
+        for feature, column in zip(record_batch.schema.names, record_batch.columns, strict=True):
+            values = column.to_numpy(zero_copy_only=False)
+            batch[feature] = values if pa.types.is_floating(column.type) else tf.convert_to_tensor(values)
+        return batch
+
+    def _process_batch(self, batch: tf.Tensor) -> None:
+        """Update statistics accumulators for each batch.
+
+        Args:
+            batch: A batch of data from the dataset.
+        """
+        if self._numeric_items:
+            # stacking all numeric columns so their moments are reduced in a single vectorized pass
+            values = np.stack(
+                [np.asarray(batch[feature], dtype=np.float32).ravel() for feature, _ in self._numeric_items],
+                axis=1,
+            )
+            # an empty batch (e.g. the end of the dataset) has nothing to merge
+            if values.shape[0]:
+                n_b, means_b, m2s_b = _batch_moments(values)
+                for (_, accumulator), mean_b, m2_b in zip(self._numeric_items, means_b, m2s_b, strict=True):
+                    accumulator.merge(n_b=n_b, mean_b=mean_b, m2_b=m2_b)
+
+        for feature, accumulator in self._categorical_items:
+            accumulator.update(batch[feature])
+
+        for feature, accumulator in self._text_items:
+            accumulator.update(batch[feature])
+
+        for feature, accumulator in self._date_items:
+            accumulator.update(batch[feature])
 
     def _compute_final_statistics(self) -> dict[str, dict]:
         """Compute final statistics for numeric, categorical, text, and date features."""
@@ -314,59 +666,54 @@ class DatasetStatistics:
             "text_stats": {},
             "date_stats": {},
         }
-        for feature in self.numeric_features:
+        for feature, accumulator in self._numeric_items:
             final_stats["numeric_stats"][feature] = {
-                "mean": self.numeric_stats[feature].mean.numpy(),
-                "count": self.numeric_stats[feature].count.numpy(),
-                "var": self.numeric_stats[feature].variance.numpy(),
+                "mean": np.float32(accumulator.mean),
+                "count": accumulator.count,
+                "var": np.float32(accumulator.variance),
                 "dtype": self.features_specs[feature].dtype,
             }
 
-        for feature in self.categorical_features:
-            _dtype = self.features_specs[feature].dtype
+        for feature, accumulator in self._categorical_items:
+            _dtype = accumulator.dtype
             if _dtype == tf.int32:
-                unique_values = [int(_byte) for _byte in self.categorical_stats[feature].get_unique_values()]
-                unique_values.sort()
+                unique_values = accumulator.get_unique_values()
             else:
-                _unique_values = self.categorical_stats[feature].get_unique_values()
-                unique_values = [(_byte).decode("utf-8") for _byte in _unique_values]
+                unique_values = [(_byte).decode("utf-8") for _byte in accumulator.get_unique_values()]
             final_stats["categorical_stats"][feature] = {
                 "size": len(unique_values),
                 "vocab": unique_values,
                 "dtype": _dtype,
             }
 
-        for feature in self.text_features:
-            unique_words = self.text_stats[feature].get_unique_words()
+        for feature, accumulator in self._text_items:
+            unique_words = accumulator.get_unique_words()
             final_stats["text_stats"][feature] = {
                 "size": len(unique_words),
                 "vocab": unique_words,
                 "dtype": self.features_specs[feature].dtype,
             }
 
-        for feature in self.date_features:
-            # init stats dates
+        for feature, accumulator in self._date_items:
+            _means_data: dict = accumulator.mean
+            _vars_data: dict = accumulator.variance
             final_stats["date_stats"][feature] = {}
-
-            # adding means stats
-            _means_data: dict = self.date_stats[feature].mean
             for feat_name in _means_data:
-                final_stats["date_stats"][feature][f"mean_{feat_name}"] = _means_data.get("feat_name", 0)
-
-            # adding var stats
-            _vars_data: dict = self.date_stats[feature].variance
-            for feat_name in _vars_data:
-                final_stats["date_stats"][feature][f"mean_{feat_name}"] = _vars_data.get("feat_name", 0)
+                final_stats["date_stats"][feature][f"mean_{feat_name}"] = _means_data[feat_name]
+                final_stats["date_stats"][feature][f"var_{feat_name}"] = _vars_data[feat_name]
 
         return final_stats
 
-    def calculate_dataset_statistics(self, dataset: tf.data.Dataset) -> dict[str, dict]:
+    def calculate_dataset_statistics(self, dataset: tf.data.Dataset | Iterable[dict]) -> dict[str, dict]:
         """Calculates and returns statistics for the dataset.
 
         Args:
-            dataset: The dataset for which to calculate statistics.
+            dataset: The dataset, or any iterable of batches, for which to calculate statistics.
         """
         logger.info("Calculating statistics for the dataset 📊")
+        if isinstance(dataset, tf.data.Dataset):
+            # prefetching lets the reading / decoding of the next batches overlap with the accumulators updates
+            dataset = dataset.prefetch(tf.data.AUTOTUNE)
         for batch in dataset:
             self._process_batch(batch)
 
@@ -395,9 +742,7 @@ class DatasetStatistics:
         """Saving feature stats locally."""
         logger.info(f"Saving feature stats locally to: {self.features_stats_path}")
 
-        # Convert the string path to a Path object before calling open
-        path_obj = Path(self.features_stats_path)
-        with path_obj.open("w") as f:
+        with self.features_stats_path.open("w") as f:
             json.dump(self.features_stats, f, default=self._custom_serializer)
         logger.info("features_stats saved ✅")
 
@@ -411,10 +756,9 @@ class DatasetStatistics:
             logger.info("overwrite_stats is currently active ⚙️")
             return {}
 
-        stats_path = Path(self.features_stats_path)
-        if stats_path.is_file():
+        if self.features_stats_path.is_file():
             logger.info(f"Found columns statistics, loading as features_stats: {self.features_stats_path}")
-            with stats_path.open() as f:
+            with self.features_stats_path.open() as f:
                 self.features_stats = json.load(f)
 
             # Convert dtype strings back to TensorFlow dtype objects
@@ -428,13 +772,105 @@ class DatasetStatistics:
             self.features_stats = {}
         return self.features_stats
 
-    def main(self) -> dict:
+    def _read_data(self, paths_csvs: list[Path] = None) -> tf.data.Dataset | Iterator[dict]:
+        """Reading CSV files with the configured reader.
+
+        Args:
+            paths_csvs: The CSV files to read (defaults to None, reading all CSV files of the provided path).
+        """
+        if self.reader == ReaderOptions.ARROW:
+            return self._read_data_into_batches(paths_csvs=paths_csvs)
+        return self._read_data_into_dataset(paths_csvs=paths_csvs)
+
+    def _get_worker_config(self) -> dict:
+        """Builds the arguments needed to recreate the statistics accumulators in a worker process.
+
+        Only the name, type and dtype of each feature are kept, so the preprocessors (e.g. Keras layers)
+        attached to the features specs are never sent to the workers.
+
+        Returns:
+            dict: Keyword arguments for DatasetStatistics.
+        """
+        features_specs = {}
+        for name, spec in self.features_specs.items():
+            feature = Feature(name=spec.name, feature_type=spec.feature_type)
+            feature.dtype = spec.dtype
+            features_specs[name] = feature
+        return {
+            "path_data": self.path_data,
+            "features_specs": features_specs,
+            "numeric_features": self.numeric_features,
+            "categorical_features": self.categorical_features,
+            "text_features": self.text_features,
+            "date_features": self.date_features,
+            "batch_size": self.batch_size,
+            "reader": self.reader,
+        }
+
+    def calculate_dataset_statistics_in_workers(self, num_workers: int) -> dict[str, dict]:
+        """Calculates and returns statistics for the dataset, sharding its CSV files across worker processes.
+
+        Each worker accumulates the statistics of a contiguous shard of files, the shards are then combined
+        in file order, so the vocabularies keep the same order as with a single process.
+
+        Note:
+            Workers are spawned, so the calling script must be guarded by `if __name__ == "__main__":`.
+
+        Args:
+            num_workers: The number of worker processes.
+        """
+        _paths_csvs = self._get_csv_files()
+        _shard_size = max(1, -(-len(_paths_csvs) // num_workers))
+        shards = [_paths_csvs[i : i + _shard_size] for i in range(0, len(_paths_csvs), _shard_size)]
+        if len(shards) <= 1:
+            # a single shard gains nothing from spawning a worker
+            return self.calculate_dataset_statistics(dataset=self._read_data())
+
+        logger.info(f"Calculating statistics for the dataset with {len(shards)} workers 📊")
+        worker_config = self._get_worker_config()
+        with multiprocessing.get_context("spawn").Pool(processes=len(shards)) as pool:
+            shards_stats = pool.starmap(_calculate_shard_statistics, [(worker_config, shard) for shard in shards])
+
+        combined = functools.reduce(DatasetStatistics.combine, shards_stats, self)
+        self._set_accumulators(
+            numeric_stats=combined.numeric_stats,
+            categorical_stats=combined.categorical_stats,
+            text_stats=combined.text_stats,
+            date_stats=combined.date_stats,
+        )
+
+        # calculating data statistics
+        self.features_stats = self._compute_final_statistics()
+
+        return self.features_stats
+
+    def main(self, num_workers: int = 1) -> dict:
         """Calculates and returns final statistics for the dataset.
 
+        Args:
+            num_workers: The number of worker processes to shard the CSV files across (defaults to 1).
+
         Resturns:
             A dictionary containing the calculated statistics for the dataset.
         """
-        ds = self._read_data_into_dataset()
-        stats = self.calculate_dataset_statistics(dataset=ds)
+        if num_workers > 1:
+            stats = self.calculate_dataset_statistics_in_workers(num_workers=num_workers)
+        else:
+            stats = self.calculate_dataset_statistics(dataset=self._read_data())
         self._save_stats()
         return stats
+
+
+def _calculate_shard_statistics(worker_config: dict, paths_csvs: list[Path]) -> DatasetStatistics:
+    """Accumulates the statistics of a shard of CSV files, run in a worker process.
+
+    Args:
+        worker_config: Keyword arguments used to create the DatasetStatistics instance of the worker.
+        paths_csvs: The CSV files of the shard.
+
+    Returns:
+        DatasetStatistics: The worker instance with the accumulators updated over the shard.
+    """
+    stats = DatasetStatistics(**worker_config)
+    stats.calculate_dataset_statistics(dataset=stats._read_data(paths_csvs=paths_csvs))
+    return stats
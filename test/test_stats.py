@@ -1,3 +1,4 @@
+import pickle
 import tempfile
 import unittest
 from pathlib import Path
@@ -7,12 +8,16 @@ import numpy as np
 import pandas as pd
 import tensorflow as tf
 
+from kdp import stats as kdp_stats
 from kdp.stats import (
     CategoricalAccumulator,
     CategoricalFeature,
     DatasetStatistics,
+    DateAccumulator,
     FeatureType,
     NumericalFeature,
+    ReaderOptions,
+    TextAccumulator,
     WelfordAccumulator,
 )
 
@@ -26,23 +31,56 @@ class TestWelfordAccumulator(unittest.TestCase):
 
     def test_initial_state(self):
         """Ensure initial state is correctly set."""
-        self.assertEqual(self.accumulator.n.numpy(), 0.0)
-        self.assertEqual(self.accumulator.mean.numpy(), 0.0)
-        self.assertEqual(self.accumulator.M2.numpy(), 0.0)
+        self.assertEqual(self.accumulator.n, 0.0)
+        self.assertEqual(self.accumulator.mean, 0.0)
+        self.assertEqual(self.accumulator.M2, 0.0)
 
     def test_update_single_value(self):
         """Test updating the accumulator with a single value."""
         self.accumulator.update(tf.constant([5.0]))
-        self.assertEqual(self.accumulator.count.numpy(), 1)
-        self.assertEqual(self.accumulator.mean.numpy(), 5.0)
+        self.assertEqual(self.accumulator.count, 1)
+        self.assertEqual(self.accumulator.mean, 5.0)
 
     def test_update_multiple_values(self):
         """Test updating the accumulator with multiple values."""
         values = tf.constant([1.0, 2.0, 3.0, 4.0, 5.0])
         self.accumulator.update(values)
-        self.assertAlmostEqual(self.accumulator.mean.numpy(), 3.0, places=5)
-        self.assertEqual(self.accumulator.count.numpy(), 5)
-        self.assertAlmostEqual(self.accumulator.variance.numpy(), 2.5, places=5)
+        self.assertAlmostEqual(self.accumulator.mean, 3.0, places=5)
+        self.assertEqual(self.accumulator.count, 5)
+        self.assertAlmostEqual(self.accumulator.variance, 2.5, places=5)
+
+    def test_update_multiple_batches(self):
+        """Test that updating batch by batch matches a single update over all values."""
+        self.accumulator.update(tf.constant([1.0, 2.0]))
+        self.accumulator.update(tf.constant([3.0, 4.0, 5.0]))
+        self.assertAlmostEqual(self.accumulator.mean, 3.0, places=5)
+        self.assertEqual(self.accumulator.count, 5)
+        self.assertAlmostEqual(self.accumulator.variance, 2.5, places=5)
+
+    def test_update_empty_batch(self):
+        """Test that an empty batch leaves the accumulator unchanged."""
+        self.accumulator.update(tf.constant([2.0, 4.0]))
+        self.accumulator.update(tf.constant([], dtype=tf.float32))
+        self.assertEqual(self.accumulator.count, 2)
+        self.assertAlmostEqual(self.accumulator.mean, 3.0, places=5)
+
+    def test_combine(self):
+        """Test that combining two accumulators matches a single accumulator over all values."""
+        other = WelfordAccumulator()
+        self.accumulator.update(tf.constant([1.0, 2.0]))
+        other.update(tf.constant([3.0, 4.0, 5.0]))
+        combined = WelfordAccumulator.combine(self.accumulator, other)
+        self.assertEqual(combined.count, 5)
+        self.assertAlmostEqual(combined.mean, 3.0, places=5)
+        self.assertAlmostEqual(combined.variance, 2.5, places=5)
+
+    def test_combine_with_empty(self):
+        """Test that combining with an empty accumulator keeps the statistics unchanged."""
+        self.accumulator.update(tf.constant([2.0, 4.0]))
+        combined = WelfordAccumulator.combine(WelfordAccumulator(), self.accumulator)
+        self.assertEqual(combined.count, 2)
+        self.assertAlmostEqual(combined.mean, 3.0, places=5)
+        self.assertAlmostEqual(combined.variance, 2.0, places=5)
 
     def test_variance_n_equals_1(self):
         """Verify that variance is 0 when n equals 1."""
@@ -59,8 +97,9 @@ class TestCategoricalAccumulator(unittest.TestCase):
 
     def test_initial_state(self):
         """Ensure initial state is correctly set."""
-        self.assertEqual(len(self.accumulator.values.numpy()), 0)
-        self.assertEqual(len(self.accumulator.int_values.numpy()), 0)
+        self.assertEqual(self.accumulator.dtype, tf.string)
+        self.assertEqual(len(self.accumulator._values), 0)
+        self.assertEqual(self.accumulator.get_unique_values(), [])
 
     def test_update_string_values(self):
         """Test updating the accumulator with string values."""
@@ -68,19 +107,212 @@ class TestCategoricalAccumulator(unittest.TestCase):
         self.assertIn("apple", [_bytes.decode("utf-8") for _bytes in self.accumulator.get_unique_values()])
         self.assertIn("banana", [_bytes.decode("utf-8") for _bytes in self.accumulator.get_unique_values()])
 
+    def test_update_string_values_across_batches(self):
+        """Test that values repeated across batches are only accumulated once."""
+        self.accumulator.update(tf.constant(["apple", "banana"]))
+        self.accumulator.update(tf.constant(["banana", "cherry"]))
+        unique_values = [_bytes.decode("utf-8") for _bytes in self.accumulator.get_unique_values()]
+        self.assertEqual(unique_values, ["apple", "banana", "cherry"])
+
     def test_update_int_values(self):
         """Test updating the accumulator with integer values."""
-        self.accumulator.update(tf.constant([1, 2, 2]))
-        unique_values = [int(_el) for _el in self.accumulator.get_unique_values()]
-        self.assertIn(1, unique_values)
-        self.assertIn(2, unique_values)
-        self.assertEqual(len(unique_values), 2)
+        accumulator = CategoricalAccumulator(dtype=tf.int32)
+        accumulator.update(tf.constant([1, 2, 2]))
+        accumulator.update(tf.constant([3, 1]))
+        self.assertEqual(accumulator.get_unique_values(), [1, 2, 3])
 
     def test_update_unsupported_dtype(self):
         """Test updating the accumulator with an unsupported data type."""
         with self.assertRaises(ValueError):
             self.accumulator.update(tf.constant([1.0, 2.0], dtype=tf.float32))
 
+    def test_combine(self):
+        """Test that combining keeps the first-seen order of both vocabularies."""
+        other = CategoricalAccumulator()
+        self.accumulator.update(tf.constant(["apple", "banana"]))
+        other.update(tf.constant(["banana", "cherry"]))
+        combined = CategoricalAccumulator.combine(self.accumulator, other)
+        self.assertEqual(
+            [_bytes.decode("utf-8") for _bytes in combined.get_unique_values()], ["apple", "banana", "cherry"]
+        )
+
+    def test_combine_different_dtypes(self):
+        """Test that accumulators of different data types cannot be combined."""
+        with self.assertRaises(ValueError):
+            CategoricalAccumulator.combine(self.accumulator, CategoricalAccumulator(dtype=tf.int32))
+
+    def test_update_string_accumulator_int_values(self):
+        """Test that integer values fed to a string accumulator are kept as strings."""
+        self.accumulator.update(tf.constant([75001, 10115, 75001]))
+        self.assertEqual(
+            [_bytes.decode("utf-8") for _bytes in self.accumulator.get_unique_values()], ["75001", "10115"]
+        )
+
+    def test_init_unsupported_dtype(self):
+        """Test initializing the accumulator with an unsupported data type."""
+        with self.assertRaises(ValueError):
+            CategoricalAccumulator(dtype=tf.float32)
+
+    def test_update_empty_batch(self):
+        """Test that an empty batch leaves the accumulator unchanged."""
+        self.accumulator.update(tf.constant([], dtype=tf.string))
+        self.assertEqual(self.accumulator.get_unique_values(), [])
+
+
+class TestTextAccumulator(unittest.TestCase):
+    """Unit tests for the TextAccumulator class."""
+
+    def setUp(self) -> None:
+        """Set up test cases for TextAccumulator."""
+        self.accumulator = TextAccumulator()
+
+    def test_initial_state(self):
+        """Ensure initial state is correctly set."""
+        self.assertEqual(self.accumulator.get_unique_words(), [])
+
+    def test_update_text_values(self):
+        """Test that words are split, lowercased and deduplicated across batches."""
+        self.accumulator.update(tf.constant(["Hello world", "hello  there"]))
+        self.accumulator.update(tf.constant(["World peace"]))
+        self.assertEqual(self.accumulator.get_unique_words(), ["hello", "world", "there", "peace"])
+
+    def test_update_unsupported_dtype(self):
+        """Test updating the accumulator with an unsupported data type."""
+        with self.assertRaises(ValueError):
+            self.accumulator.update(tf.constant([1, 2]))
+
+    def test_update_mixed_whitespace(self):
+        """Test that tabs, newlines and repeated spaces all act as word separators."""
+        self.accumulator.update(tf.constant(["one\ttwo\nthree   four"]))
+        self.assertEqual(sorted(self.accumulator.get_unique_words()), ["four", "one", "three", "two"])
+
+
+class TestDatasetStatisticsDigitOnlyStrings(unittest.TestCase):
+    """Unit tests for string categorical columns whose values only contain digits."""
+
+    def test_digit_only_string_categorical(self):
+        """Test that a digit-only string column, inferred as integers by tf.data, keeps a string vocabulary."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pd.DataFrame({"zip_code": [75001, 10115, 75001, 20095]}).to_csv(Path(temp_dir) / "data.csv", index=False)
+            stats = DatasetStatistics(
+                path_data=temp_dir,
+                features_specs={
+                    "zip_code": CategoricalFeature(name="zip_code", feature_type=FeatureType.STRING_CATEGORICAL),
+                },
+                categorical_features=["zip_code"],
+            )
+            final_stats = stats.calculate_dataset_statistics(dataset=stats._read_data_into_dataset())
+        zip_code_stats = final_stats["categorical_stats"]["zip_code"]
+        self.assertEqual(zip_code_stats["vocab"], ["75001", "10115", "20095"])
+        self.assertEqual(zip_code_stats["size"], 3)
+        self.assertEqual(zip_code_stats["dtype"], tf.string)
+
+
+class TestDateAccumulator(unittest.TestCase):
+    """Unit tests for the DateAccumulator class."""
+
+    def test_final_statistics(self):
+        """Test that the date means and variances are reported under their own keys."""
+        stats = DatasetStatistics(path_data="path/to/dataset", date_features=["date"])
+        stats.date_stats["date"].update(tf.constant([[2020.0, 3.0, 0.0], [2022.0, 3.0, 0.0]]))
+        date_stats = stats._compute_final_statistics()["date_stats"]["date"]
+        self.assertAlmostEqual(date_stats["mean_year"], 2021.0, places=5)
+        self.assertAlmostEqual(date_stats["var_year"], 2.0, places=5)
+        self.assertAlmostEqual(date_stats["mean_month_sin"], 1.0, places=5)
+        self.assertAlmostEqual(date_stats["var_month_sin"], 0.0, places=5)
+        self.assertAlmostEqual(date_stats["mean_day_of_week_cos"], 1.0, places=5)
+        self.assertEqual(len(date_stats), 10)
+
+
+class TestDatasetStatisticsCombine(unittest.TestCase):
+    """Unit tests for combining DatasetStatistics instances built over shards of a dataset."""
+
+    def test_combine_pickled_shards(self):
+        """Test that shards sent through pickle combine into the statistics of the whole dataset."""
+        features_specs = {"a": NumericalFeature(name="a", feature_type=FeatureType.FLOAT)}
+        shards = []
+        for values in [[1.0, 2.0], [3.0, 4.0, 5.0]]:
+            stats = DatasetStatistics(
+                path_data="path/to/dataset",
+                features_specs=features_specs,
+                numeric_features=["a"],
+            )
+            stats = pickle.loads(pickle.dumps(stats))
+            stats._process_batch({"a": tf.constant(values)})
+            shards.append(pickle.loads(pickle.dumps(stats)))
+        combined = DatasetStatistics.combine(*shards)
+        final_stats = combined._compute_final_statistics()["numeric_stats"]["a"]
+        self.assertEqual(final_stats["count"], 5)
+        self.assertAlmostEqual(final_stats["mean"], 3.0, places=5)
+        self.assertAlmostEqual(final_stats["var"], 2.5, places=5)
+        # the shards themselves are left untouched
+        self.assertEqual(shards[0].numeric_stats["a"].count, 2)
+
+
+class TestDatasetStatisticsWorkers(unittest.TestCase):
+    """End-to-end tests for calculating the statistics of a multi-file dataset in worker processes."""
+
+    def test_workers_match_single_process(self):
+        """Test that main with 2 workers gives the same statistics and vocabulary order as a single process."""
+        features_specs = {
+            "feat_a": NumericalFeature(name="feat_a", feature_type=FeatureType.FLOAT),
+            "feat_b": CategoricalFeature(name="feat_b", feature_type=FeatureType.INTEGER_CATEGORICAL),
+            "feat_c": CategoricalFeature(name="feat_c", feature_type=FeatureType.STRING_CATEGORICAL),
+        }
+        # a Keras layer attached to a feature must not be needed by the workers
+        features_specs["feat_a"].add_preprocessor(tf.keras.layers.Dense(1))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _path_data = Path(temp_dir) / "data"
+            _path_data.mkdir()
+            pd.DataFrame({"feat_a": [1.0, 2.0, 3.0], "feat_b": [3, 1, 3], "feat_c": ["dog", "cat", "dog"]}).to_csv(
+                _path_data / "part_0.csv",
+                index=False,
+            )
+            pd.DataFrame({"feat_a": [4.0, 5.0], "feat_b": [2, 0], "feat_c": ["fish", "cat"]}).to_csv(
+                _path_data / "part_1.csv",
+                index=False,
+            )
+            _stats = {}
+            for num_workers in [1, 2]:
+                _data_stats = DatasetStatistics(
+                    path_data=_path_data,
+                    features_specs=features_specs,
+                    numeric_features=["feat_a"],
+                    categorical_features=["feat_b", "feat_c"],
+                    features_stats_path=Path(temp_dir) / f"features_stats_{num_workers}.json",
+                )
+                _stats[num_workers] = _data_stats.main(num_workers=num_workers)
+
+        single, workers = _stats[1], _stats[2]
+        self.assertEqual(workers["numeric_stats"]["feat_a"]["count"], 5)
+        self.assertEqual(single["numeric_stats"]["feat_a"]["count"], workers["numeric_stats"]["feat_a"]["count"])
+        self.assertAlmostEqual(
+            single["numeric_stats"]["feat_a"]["mean"], workers["numeric_stats"]["feat_a"]["mean"], places=5
+        )
+        self.assertAlmostEqual(
+            single["numeric_stats"]["feat_a"]["var"], workers["numeric_stats"]["feat_a"]["var"], places=5
+        )
+        self.assertEqual(workers["categorical_stats"]["feat_b"]["vocab"], [0, 1, 2, 3])
+        self.assertEqual(workers["categorical_stats"]["feat_c"]["vocab"], ["dog", "cat", "fish"])
+        self.assertEqual(single["categorical_stats"], workers["categorical_stats"])
+
+    def test_single_file_does_not_spawn_workers(self):
+        """Test that a dataset with a single CSV file is processed without a worker pool."""
+        features_specs = {"feat_a": NumericalFeature(name="feat_a", feature_type=FeatureType.FLOAT)}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pd.DataFrame({"feat_a": [1.0, 2.0, 3.0]}).to_csv(Path(temp_dir) / "part_0.csv", index=False)
+            _data_stats = DatasetStatistics(
+                path_data=temp_dir,
+                features_specs=features_specs,
+                numeric_features=["feat_a"],
+            )
+            with patch.object(kdp_stats.multiprocessing, "get_context") as mock_get_context:
+                _stats = _data_stats.calculate_dataset_statistics_in_workers(num_workers=4)
+
+        mock_get_context.assert_not_called()
+        self.assertEqual(_stats["numeric_stats"]["feat_a"]["count"], 3)
+        self.assertAlmostEqual(_stats["numeric_stats"]["feat_a"]["mean"], 2.0, places=5)
+
 
 # class TestDatasetStatistics(unittest.TestCase):
 #     """Unit tests for the DatasetStatistics class."""
@@ -275,6 +507,75 @@ class TestDatasetStatisticsPandasComparison(unittest.TestCase):
         self.assertEqual(self.df["feat_b"].nunique(), stats["categorical_stats"]["feat_b"]["size"])
         self.assertEqual(list(np.unique(self.df["feat_b"])), stats["categorical_stats"]["feat_b"]["vocab"])
 
+    @unittest.skipIf(kdp_stats.pa is None, "pyarrow is not installed")
+    def test_stats_arrow_vs_tf(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # a missing value in any feature column skips the whole row with both readers
+            _path_missing = Path(temp_dir) / "missing.csv"
+            pd.DataFrame(
+                {
+                    "feat_a": [1.0, np.nan, 3.0, 4.0, 5.0],
+                    "feat_b": [3, 1, None, 2, 0],
+                    "feat_c": ["dog", "cat", "fish", None, "bird"],
+                },
+            ).astype({"feat_b": "Int64"}).to_csv(_path_missing, index=False)
+
+            for path_data in [self._path_data, _path_missing]:
+                _stats = {}
+                for reader in [ReaderOptions.TF_DATA, ReaderOptions.ARROW]:
+                    _data_stats = DatasetStatistics(
+                        path_data=path_data,
+                        features_specs=self.features_scope,
+                        numeric_features=self.numeric_features,
+                        categorical_features=self.categorical_features,
+                        batch_size=3,
+                        reader=reader,
+                    )
+                    _stats[reader] = _data_stats.calculate_dataset_statistics(dataset=_data_stats._read_data())
+                tf_stats, arrow_stats = _stats[ReaderOptions.TF_DATA], _stats[ReaderOptions.ARROW]
+                for stat in ["count", "mean", "var"]:
+                    self.assertAlmostEqual(
+                        tf_stats["numeric_stats"]["feat_a"][stat],
+                        arrow_stats["numeric_stats"]["feat_a"][stat],
+                        places=5,
+                    )
+                self.assertEqual(tf_stats["categorical_stats"], arrow_stats["categorical_stats"])
+
+        self.assertEqual(arrow_stats["numeric_stats"]["feat_a"]["count"], 2)
+        self.assertAlmostEqual(arrow_stats["numeric_stats"]["feat_a"]["mean"], 3.0, places=5)
+        self.assertEqual(arrow_stats["categorical_stats"]["feat_b"]["vocab"], [0, 3])
+        self.assertEqual(arrow_stats["categorical_stats"]["feat_c"]["vocab"], ["dog", "bird"])
+
+    @unittest.skipIf(kdp_stats.pa is None, "pyarrow is not installed")
+    def test_arrow_reader_batch_size(self):
+        _data_stats = DatasetStatistics(
+            path_data=self._path_data,
+            features_specs=self.features_scope,
+            numeric_features=self.numeric_features,
+            categorical_features=self.categorical_features,
+            batch_size=3,
+            reader=ReaderOptions.ARROW,
+        )
+        batch_sizes = [len(batch["feat_a"]) for batch in _data_stats._read_data()]
+        self.assertEqual(batch_sizes, [3, 3, 3, 1])
+
+    @unittest.skipIf(kdp_stats.pa is None, "pyarrow is not installed")
+    def test_arrow_reader_unparsable_value(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pd.DataFrame({"feat_a": ["1.0", "abc"]}).to_csv(Path(temp_dir) / "data.csv", index=False)
+            _data_stats = DatasetStatistics(
+                path_data=temp_dir,
+                features_specs={"feat_a": NumericalFeature(name="feat_a", feature_type=FeatureType.FLOAT)},
+                numeric_features=["feat_a"],
+                reader=ReaderOptions.ARROW,
+            )
+            with self.assertRaises(ValueError):
+                list(_data_stats._read_data())
+
+    def test_unsupported_reader(self):
+        with self.assertRaises(ValueError):
+            DatasetStatistics(path_data=self._path_data, reader="parquet")
+
 
 # ============= NEW TESTS ==============
 # class TestDatasetStatistics(unittest.TestCase):